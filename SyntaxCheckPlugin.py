@@ -140,6 +140,9 @@ class RustSyntaxCheckThread(rust_thread.RustThread, rust_proc.ProcListener):
         :returns: Returns the process return code.
         """
         method = util.get_setting('rust_syntax_checking_method', 'check')
+        # Use a private instance: this runs on the check thread, and the
+        # shared per-window instance may be reloaded by the main thread at
+        # any time.
         settings = cargo_settings.CargoSettings(self.window)
         settings.load()
         command_info = cargo_settings.CARGO_COMMANDS[method]
@@ -1,5 +1,6 @@
 """Sublime commands for the cargo build system."""
 
+import collections
 import functools
 import sublime
 import sublime_plugin
@@ -41,22 +42,31 @@ class CargoExecCommand(sublime_plugin.WindowCommand):
     # Path used for the settings key.  This is typically `working_dir` except
     # for `cargo script`, in which case it is the path to the .rs source file.
     settings_path = None
+    # When True, the next `run` keeps the already-loaded `settings` instance
+    # instead of loading the project data again.
+    _reuse_settings = False
 
     def run(self, command=None, command_info=None, settings=None):
         if command is None:
             return self.window.run_command('build', {'select': True})
         clear_log(self.window)
         self.initial_settings = settings if settings else {}
-        self.settings = cargo_settings.CargoSettings(self.window)
-        self.settings.load()
+        if not self._reuse_settings:
+            # The shared per-window instance, freshly loaded.  The "auto"
+            # variant re-enters here after picking a target and keeps the
+            # already-loaded instance instead.
+            self.settings = cargo_settings.CargoSettings.get(self.window)
+        self._reuse_settings = False
         if command == 'auto':
             self._detect_auto_build()
         else:
             self.command_name = command
-            self.command_info = cargo_settings.CARGO_COMMANDS\
-                .get(command, {}).copy()
-            if command_info:
-                self.command_info.update(command_info)
+            # Overlay the user's overrides on the static command info instead
+            # of copying (a shallow copy would share any nested values
+            # anyways).
+            self.command_info = collections.ChainMap(
+                command_info or {},
+                cargo_settings.CARGO_COMMANDS.get(command, {}))
             self._determine_working_path(self._run_check_for_args)
 
     def _detect_auto_build(self):
@@ -102,6 +112,7 @@ class CargoExecCommand(sublime_plugin.WindowCommand):
             }
             cmd = actions[cmd_line[0]]
             self.initial_settings['target'] = ' '.join(cmd_line)
+            self._reuse_settings = True
             self.run(command=cmd, settings=self.initial_settings)
 
     def _determine_working_path(self, on_done):
@@ -168,11 +179,16 @@ class CargoExecCommand(sublime_plugin.WindowCommand):
         self._run()
 
     def _run(self):
-        t = CargoExecThread(self.window, self.settings,
+        # Give the thread its own loaded snapshot; the shared per-window
+        # instance may be reloaded by a later command on the main thread
+        # while the thread is still reading it.
+        settings = cargo_settings.CargoSettings(self.window)
+        settings.load()
+        t = CargoExecThread(self.window, settings,
                             self.command_name, self.command_info,
                             self.initial_settings,
                             self.settings_path, self.working_dir)
-        t.start()
+        t.start(synchronous=self.command_info.get('synchronous', False))
 
 
 class CargoExecThread(rust_thread.RustThread):
@@ -237,7 +253,8 @@ class MessagesViewEventListener(sublime_plugin.ViewEventListener):
         return False
 
     def on_load_async(self):
-        messages.show_messages_for_view(self.view)
+        if messages.has_any_messages():
+            messages.show_messages_for_view(self.view)
 
 
 class NextPrevBase(sublime_plugin.WindowCommand):
@@ -529,6 +546,14 @@ class RustEventListener(sublime_plugin.EventListener):
         # It would be preferable to use ViewEventListener, but it doesn't work
         # on duplicate views created with Goto Anything.
         def activate():
+            # Quick check to avoid the scope_name query when there is
+            # nothing to display.
+            if not messages.has_any_messages():
+                if util.get_setting('rust_message_status_bar', False):
+                    # The view may still carry status text from a message
+                    # that has since been cleared.
+                    messages.erase_status(view)
+                return
             if not util.active_view_is_rust(view=view):
                 return
             if util.get_setting('rust_message_status_bar', False):
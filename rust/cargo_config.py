@@ -3,18 +3,108 @@
 See `cargo_settings` for more details on how settings work.
 """
 
+import concurrent.futures
 import getpass
+import operator
 import os
 import re
 import sublime
 import sublime_plugin
+import time
 from .cargo_settings import CargoSettings, CARGO_COMMANDS
 from .util import index_with, get_cargo_metadata
-from . import rust_proc, util, log
+from . import util, log
 
 # Keep track of recent choices to set the default value.
 RECENT_CHOICES = {}
 
+# CARGO_COMMANDS is static, so the variant lists can be computed once at
+# module load instead of re-filtering on every panel display.
+_ALL_VARIANTS = tuple(sorted(
+    (info['name'], key) for key, info in CARGO_COMMANDS.items()))
+_TARGET_VARIANTS = tuple(sorted(
+    (info['name'], key) for key, info in CARGO_COMMANDS.items()
+    if info.get('allows_target', False)))
+
+# Static quick-panel choices.  The "which" rows are (text template, extra
+# description, value) triples; the template is filled in with the concrete
+# setting name when the panel is shown.
+_PROFILE_ITEMS = (('Dev', 'dev'), ('Release', 'release'))
+_NO_DEFAULT_FEATURES_ITEMS = (
+    ('Include default features.', False),
+    ('Do not include default features.', True),
+)
+_WHICH_VARIANT_EXTRA = 'cargo build, cargo run, cargo test, etc.'
+_WHICH_TARGET_EXTRA = '--bin, --example, --test, etc.'
+_WHICH_GLOBAL_ITEMS = (
+    ('Set %s globally.', 'Updates RustEnhanced.sublime-settings',
+        'global_default'),
+    ('Set %s in this Sublime project.', '',
+        'project_default'),
+    ('Set %s globally for a Build Variant.', _WHICH_VARIANT_EXTRA,
+        'global_variant'),
+    ('Set %s in this Sublime project for a Build Variant (all Cargo packages).', _WHICH_VARIANT_EXTRA,
+        'project_variant'),
+)
+_WHICH_PACKAGE_ITEMS = (
+    ('Set %s in this Sublime project for all commands (specific Cargo package).', '',
+        'project_package_default'),
+    ('Set %s in this Sublime project for a Build Variant (specific Cargo package).', _WHICH_VARIANT_EXTRA,
+        'project_package_variant'),
+    ('Set %s in this Sublime project for a Target (specific Cargo package).', _WHICH_TARGET_EXTRA,
+        'project_package_target'),
+)
+
+# Matches a toolchain name from `rustup toolchain list`, capturing the
+# channel, the optional date, and the target.
+_TOOLCHAIN_CHANNELS = ('nightly', 'beta', 'stable', '\d\.\d{1,2}\.\d')
+_TOOLCHAIN_RE = re.compile('(%s)(?:-(\d{4}-\d{2}-\d{2}))?(?:-(.*))' %
+    '|'.join(_TOOLCHAIN_CHANNELS))
+
+# Cache of rustup output, since running rustup can be somewhat slow.
+# Key is the command-line tuple, value is (timestamp, output).
+_RUSTUP_CACHE = {}
+
+# Number of seconds before rustup is queried again (so that newly installed
+# toolchains/targets are eventually noticed).
+_RUSTUP_CACHE_TTL = 30
+
+
+def _cached_rustup(window, cmd, parse=None):
+    """Run a rustup command, returning cached output if available.
+
+    :param window: The Sublime window.
+    :param cmd: The command to run (list of strings).
+    :param parse: Optional callable to post-process the output.  The
+        processed result is what gets cached, so parsing and sorting are
+        skipped entirely on a cache hit.
+
+    :returns: The command's output, as a string, or whatever `parse`
+        returned.
+    """
+    key = tuple(cmd)
+    entry = _RUSTUP_CACHE.get(key)
+    if entry is not None and time.time() - entry[0] < _RUSTUP_CACHE_TTL:
+        return entry[1]
+    # Deferred import so that the subprocess machinery is only loaded when a
+    # command actually needs to run rustup.
+    from . import rust_proc
+    output = rust_proc.check_output(window, cmd, None)
+    if parse is not None:
+        output = parse(output)
+    _RUSTUP_CACHE[key] = (time.time(), output)
+    return output
+
+
+class RustResetRustupCacheCommand(sublime_plugin.WindowCommand):
+
+    """Clears the cached rustup toolchain/target lists and cargo
+    metadata."""
+
+    def run(self):
+        _RUSTUP_CACHE.clear()
+        util.clear_metadata_cache()
+
 
 class CancelCommandError(Exception):
     """Raised when the command should stop."""
@@ -91,8 +181,7 @@ class CargoConfigBase(sublime_plugin.WindowCommand):
         # Copy, since WindowCommand reuses objects.
         self._sequence = self.sequence[:]
         self.cmd_input = kwargs
-        self.settings = CargoSettings(self.window)
-        self.settings.load()
+        self.settings = CargoSettings.get(self.window)
         self.show_next_question()
 
     def done(self):
@@ -100,6 +189,27 @@ class CargoConfigBase(sublime_plugin.WindowCommand):
         implement this."""
         raise NotImplementedError()
 
+    @classmethod
+    def _question_fns(cls):
+        """Returns a pair of dicts mapping question names to the `items_` and
+        `selected_` functions implementing them.
+
+        Computed once per class on first use, which avoids the string
+        concatenation and MRO scan of a getattr for every question.
+        """
+        fns = cls.__dict__.get('_QUESTION_FNS')
+        if fns is None:
+            item_fns = {}
+            selected_fns = {}
+            for name in dir(cls):
+                if name.startswith('items_'):
+                    item_fns[name[6:]] = getattr(cls, name)
+                elif name.startswith('selected_'):
+                    selected_fns[name[9:]] = getattr(cls, name)
+            fns = (item_fns, selected_fns)
+            cls._QUESTION_FNS = fns
+        return fns
+
     def show_next_question(self):
         if self.sequence_index < len(self._sequence):
             q = self._sequence[self.sequence_index]
@@ -108,14 +218,15 @@ class CargoConfigBase(sublime_plugin.WindowCommand):
             self.done()
             return
 
-        f_selected = getattr(self, 'selected_' + q, None)
+        item_fns, selected_fns = self._question_fns()
+        f_selected = selected_fns.get(q)
 
         # Called with the result of what the user selected.
         def make_choice(value):
             self.choices[q] = value
             if f_selected:
                 try:
-                    next = f_selected(value)
+                    next = f_selected(self, value)
                 except CancelCommandError:
                     return
                 if next:
@@ -127,7 +238,7 @@ class CargoConfigBase(sublime_plugin.WindowCommand):
             make_choice(self.cmd_input[q])
         else:
             try:
-                item_info = getattr(self, 'items_' + q)()
+                item_info = item_fns[q](self)
             except CancelCommandError:
                 return
             if not isinstance(item_info, dict):
@@ -144,22 +255,21 @@ class CargoConfigBase(sublime_plugin.WindowCommand):
                 if item_info.get('skip_if_one', False) and len(items) == 1:
                     wrapper(0)
                 else:
+                    by_value = {value: i for i, (_, value) in enumerate(items)}
                     # If the user manually edits the config and enters custom
                     # values then it won't show up in the list (because it is
                     # not an exact match).  Add it so that it is a valid
                     # choice (assuming the user entered a valid value).
                     if 'default' in item_info:
-                        default_index = index_with(items,
-                            lambda x: x[1] == item_info['default'])
-                        if default_index == -1:
+                        if item_info['default'] not in by_value:
+                            by_value[item_info['default']] = len(items)
                             items.append((item_info['default'],
                                           item_info['default']))
                     # Determine the default selection.
                     # Use the default provided by the items_ method, else
                     # use the most recently used value.
-                    default = index_with(items,
-                        lambda x: x[1] == item_info.get('default',
-                            RECENT_CHOICES.get(q, '_NO_DEFAULT_SENTINEL_')))
+                    default = by_value.get(item_info.get('default',
+                        RECENT_CHOICES.get(q, '_NO_DEFAULT_SENTINEL_')), -1)
                     display_items = [x[0] for x in items]
                     self.window.show_quick_panel(display_items, wrapper, 0,
                                                  default)
@@ -195,25 +305,39 @@ class CargoConfigBase(sublime_plugin.WindowCommand):
         # Otherwise, hunt for all manifest files and show a list.
         folders = self.window.folders()
         self.packages = {}
+        manifest_dirs = []
         for folder in folders:
-            folder_parent = os.path.dirname(folder)
             for dirpath, dirs, files, in os.walk(folder):
                 for exclude in ('.git', '.svn'):
                     if exclude in dirs:
                         dirs.remove(exclude)
                 if 'Cargo.toml' in files:
-                    metadata = get_cargo_metadata(self.window, dirpath)
-                    if metadata:
-                        for package in metadata['packages']:
-                            manifest_dir = os.path.dirname(package['manifest_path'])
-                            rel = os.path.relpath(manifest_dir, folder_parent)
-                            package['sublime_relative'] = rel
-                            if manifest_dir not in self.packages:
-                                self.packages[manifest_dir] = package
-                    else:
-                        # Manifest load failure, let it slide.
-                        log.critical(self.window,
-                            'Failed to load Cargo manifest in %r', dirpath)
+                    manifest_dirs.append((folder, dirpath))
+
+        # Load the manifests concurrently, since each one may spawn `cargo
+        # metadata`.  The results are merged serially after all of the
+        # workers have finished.
+        if manifest_dirs:
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(8, len(manifest_dirs))) as executor:
+                metadatas = list(executor.map(
+                    lambda md: get_cargo_metadata(self.window, md[1]),
+                    manifest_dirs))
+        else:
+            metadatas = []
+        for (folder, dirpath), metadata in zip(manifest_dirs, metadatas):
+            folder_parent = os.path.dirname(folder)
+            if metadata:
+                for package in metadata['packages']:
+                    manifest_dir = os.path.dirname(package['manifest_path'])
+                    rel = os.path.relpath(manifest_dir, folder_parent)
+                    package['sublime_relative'] = rel
+                    if manifest_dir not in self.packages:
+                        self.packages[manifest_dir] = package
+            else:
+                # Manifest load failure, let it slide.
+                log.critical(self.window,
+                    'Failed to load Cargo manifest in %r', dirpath)
 
         if len(self.packages) == 0:
             sublime.error_message(util.multiline_fix("""
@@ -228,7 +352,7 @@ class CargoConfigBase(sublime_plugin.WindowCommand):
 
         items = [(display_name(package), path)
             for path, package in self.packages.items()]
-        items.sort(key=lambda x: x[0])
+        items.sort(key=operator.itemgetter(0))
         return {
             'items': items,
             'skip_if_one': True,
@@ -270,12 +394,7 @@ class CargoConfigBase(sublime_plugin.WindowCommand):
         return items
 
     def items_variant(self):
-        result = []
-        for key, info in CARGO_COMMANDS.items():
-            if self.filter_variant(info):
-                result.append((info['name'], key))
-        result.sort()
-        return result
+        return list(_ALL_VARIANTS)
 
     def filter_variant(self, x):
         """Subclasses override this to filter variants from the variant
@@ -292,91 +411,59 @@ class CargoConfigBase(sublime_plugin.WindowCommand):
             elif 'target' in self.cmd_input:
                 self.cmd_input['which'] = 'project_package_target'
 
-        variant_extra = 'cargo build, cargo run, cargo test, etc.'
-        target_extra = '--bin, --example, --test, etc.'
-        result = []
-        if not self.which_requires_package:
-            result.extend([
-                (['Set %s globally.', 'Updates RustEnhanced.sublime-settings'],
-                    'global_default'),
-                (['Set %s in this Sublime project.', ''],
-                    'project_default'),
-                (['Set %s globally for a Build Variant.', variant_extra],
-                    'global_variant'),
-                (['Set %s in this Sublime project for a Build Variant (all Cargo packages).', variant_extra],
-                    'project_variant'),
-            ])
-        result.extend([
-            (['Set %s in this Sublime project for all commands (specific Cargo package).', ''],
-                'project_package_default'),
-            (['Set %s in this Sublime project for a Build Variant (specific Cargo package).', variant_extra],
-                'project_package_variant'),
-            (['Set %s in this Sublime project for a Target (specific Cargo package).', target_extra],
-                'project_package_target'),
-        ])
-        for (text, _) in result:
-            text[0] = text[0] % (self.config_name,)
-        return result
+        if self.which_requires_package:
+            rows = _WHICH_PACKAGE_ITEMS
+        else:
+            rows = _WHICH_GLOBAL_ITEMS + _WHICH_PACKAGE_ITEMS
+        return [([text % (self.config_name,), extra], value)
+                for text, extra, value in rows]
+
+    # Dispatch for the "which" selection.  Maps each scope to the
+    # CargoSettings getter/setter names and the follow-up choices the
+    # scope needs, which those methods take as leading arguments.
+    _WHICH_DISPATCH = {
+        'global_default':
+            ('get_global_default', 'set_global_default', ()),
+        'project_default':
+            ('get_project_default', 'set_project_default', ()),
+        'global_variant':
+            ('get_global_variant', 'set_global_variant', ('variant',)),
+        'project_variant':
+            ('get_project_variant', 'set_project_variant', ('variant',)),
+        'project_package_default':
+            ('get_project_package_default', 'set_project_package_default',
+                ('package',)),
+        'project_package_variant':
+            ('get_project_package_variant', 'set_project_package_variant',
+                ('package', 'variant')),
+        'project_package_target':
+            ('get_project_package_target', 'set_project_package_target',
+                ('package', 'target')),
+    }
 
     def selected_which(self, which):
-        if which in ('project_variant', 'global_variant'):
-            return ['variant']
-        elif which == 'project_package_default':
-            return ['package']
-        elif which == 'project_package_variant':
-            return ['package', 'variant']
-        elif which == 'project_package_target':
-            return ['package', 'target']
+        return list(self._WHICH_DISPATCH[which][2])
 
-    def get_setting(self, name, default=None):
-        """Retrieve a setting, honoring the "which" selection."""
+    def _which_method(self, index):
+        """Return the bound settings method and leading arguments for the
+        current "which" selection."""
         w = self.choices['which']
-        if w == 'global_default':
-            return self.settings.get_global_default(name, default)
-        elif w == 'project_default':
-            return self.settings.get_project_default(name, default)
-        elif w == 'global_variant':
-            return self.settings.get_global_variant(self.choices['variant'],
-                                                    name, default)
-        elif w == 'project_variant':
-            return self.settings.get_project_variant(self.choices['variant'],
-                                                     name, default)
-        elif w == 'project_package_default':
-            return self.settings.get_project_package_default(
-                self.choices['package'], name, default)
-        elif w == 'project_package_variant':
-            return self.settings.get_project_package_variant(
-                self.choices['package'], self.choices['variant'], name, default)
-        elif w == 'project_package_target':
-            return self.settings.get_project_package_target(
-                self.choices['package'], self.choices['target'], name, default)
-        else:
+        try:
+            entry = self._WHICH_DISPATCH[w]
+        except KeyError:
             raise AssertionError(w)
+        args = [self.choices[key] for key in entry[2]]
+        return getattr(self.settings, entry[index]), args
+
+    def get_setting(self, name, default=None):
+        """Retrieve a setting, honoring the "which" selection."""
+        getter, args = self._which_method(0)
+        return getter(*(args + [name, default]))
 
     def set_setting(self, name, value):
         """Set a setting, honoring the "which" selection."""
-        w = self.choices['which']
-        if w == 'global_default':
-            return self.settings.set_global_default(name, value)
-        elif w == 'project_default':
-            return self.settings.set_project_default(name, value)
-        elif w == 'global_variant':
-            return self.settings.set_global_variant(self.choices['variant'],
-                                                    name, value)
-        elif w == 'project_variant':
-            return self.settings.set_project_variant(self.choices['variant'],
-                                                     name, value)
-        elif w == 'project_package_default':
-            return self.settings.set_project_package_default(
-                self.choices['package'], name, value)
-        elif w == 'project_package_variant':
-            return self.settings.set_project_package_variant(
-                self.choices['package'], self.choices['variant'], name, value)
-        elif w == 'project_package_target':
-            return self.settings.set_project_package_target(
-                self.choices['package'], self.choices['target'], name, value)
-        else:
-            raise AssertionError(w)
+        setter, args = self._which_method(1)
+        return setter(*(args + [name, value]))
 
     toolchain_allows_default = True
 
@@ -395,9 +482,11 @@ class CargoConfigBase(sublime_plugin.WindowCommand):
         return result
 
     def _toolchain_list(self):
-        output = rust_proc.check_output(self.window,
-                                        'rustup toolchain list'.split(),
-                                        None)
+        return _cached_rustup(self.window, 'rustup toolchain list'.split(),
+                              parse=self._parse_toolchain_list)
+
+    @staticmethod
+    def _parse_toolchain_list(output):
         output = output.splitlines()
         system_default = index_with(output, lambda x: x.endswith(' (default)'))
         if system_default != -1:
@@ -410,10 +499,8 @@ class CargoConfigBase(sublime_plugin.WindowCommand):
         # https://static.rust-lang.org/dist/index.html
         # (See https://github.com/rust-lang-nursery/rustup.rs/issues/215)
         shorthands = []
-        channels = ['nightly', 'beta', 'stable', '\d\.\d{1,2}\.\d']
-        pattern = '(%s)(?:-(\d{4}-\d{2}-\d{2}))?(?:-(.*))' % '|'.join(channels)
         for toolchain in output:
-            m = re.match(pattern, toolchain)
+            m = _TOOLCHAIN_RE.match(toolchain)
             # Should always match.
             if m:
                 channel = m.group(1)
@@ -457,9 +544,7 @@ class CargoSetProfile(CargoConfigBase):
             default = 'release'
         else:
             default = 'dev'
-        items = [('Dev', 'dev'),
-                 ('Release', 'release')]
-        return {'items': items,
+        return {'items': list(_PROFILE_ITEMS),
                 'default': default}
 
     def done(self):
@@ -471,9 +556,8 @@ class CargoSetTarget(CargoConfigBase):
     config_name = 'Target'
     sequence = ['package', 'variant', 'target']
 
-    def filter_variant(self, info):
-        return super(CargoSetTarget, self).filter_variant(info) and \
-            info.get('allows_target', False)
+    def items_variant(self):
+        return list(_TARGET_VARIANTS)
 
     def items_target(self):
         items = super(CargoSetTarget, self).items_target()
@@ -507,25 +591,26 @@ class CargoSetTriple(CargoConfigBase):
 
         # The target list depends on the toolchain used.
         cmd = 'rustup target list --toolchain=%s' % self.choices['toolchain']
-        triples = rust_proc.check_output(self.window, cmd.split(), None)\
-            .splitlines()
+        triples = _cached_rustup(self.window, cmd.split(),
+                                 parse=self._parse_target_list)
         current = self.get_setting('target_triple')
         result = [('Use Default', None)]
-        for triple in triples:
-            if triple.endswith(' (default)'):
-                actual_triple = triple[:-10]
-                result.append((actual_triple, actual_triple))
-            elif triple.endswith(' (installed)'):
-                actual_triple = triple[:-12]
-                result.append((actual_triple, actual_triple))
-            else:
-                actual_triple = None
-            # Don't bother listing uninstalled targets.
+        result.extend(triples)
         return {
             'items': result,
             'default': current
         }
 
+    @staticmethod
+    def _parse_target_list(output):
+        triples = []
+        for triple in output.splitlines():
+            # Don't bother listing uninstalled targets.
+            if triple.endswith((' (default)', ' (installed)')):
+                actual_triple = triple.rsplit(' (', 1)[0]
+                triples.append((actual_triple, actual_triple))
+        return triples
+
     def done(self):
         self.set_setting('target_triple', self.choices['target_triple'])
 
@@ -547,12 +632,8 @@ class CargoSetFeatures(CargoConfigBase):
 
     def items_no_default_features(self):
         current = self.get_setting('no_default_features', False)
-        items = [
-            ('Include default features.', False),
-            ('Do not include default features.', True)
-        ]
         return {
-            'items': items,
+            'items': list(_NO_DEFAULT_FEATURES_ITEMS),
             'default': current,
         }
 
@@ -562,15 +643,13 @@ class CargoSetFeatures(CargoConfigBase):
             # Detect available features from the manifest.
             package_path = self.choices['package']
             available_features = self.packages[package_path].get('features', {})
-            items = list(available_features.keys())
             # Remove the "default" entry.
-            if 'default' in items:
-                del items[items.index('default')]
-                if not self.choices['no_default_features']:
-                    # Don't show default features, (they are already included).
-                    for ft in available_features['default']:
-                        if ft in items:
-                            del items[items.index(ft)]
+            skip = {'default'}
+            if 'default' in available_features and \
+                    not self.choices['no_default_features']:
+                # Don't show default features, (they are already included).
+                skip.update(available_features['default'])
+            items = [x for x in available_features if x not in skip]
             features = ' '.join(items)
         return {
             'caption': 'Choose features (space separated, use "ALL" to use all features)',
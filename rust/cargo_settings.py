@@ -116,6 +116,22 @@ CARGO_COMMANDS = {
 CARGO_BUILD_DEFAULTS = {
 }
 
+# Shared read-only default for nested `get` chains, so that probing a
+# missing key doesn't allocate a fresh dict at every level.  Never mutate.
+_EMPTY = {}
+
+# Map Sublime window ID to the shared CargoSettings instance for that
+# window (see `CargoSettings.get`).
+_SETTINGS_BY_WINDOW = {}
+
+
+def _descend(d, *keys):
+    """Walk nested dicts, creating levels as needed, and return the
+    innermost one."""
+    for k in keys:
+        d = d.setdefault(k, {})
+    return d
+
 
 class CargoSettings(object):
 
@@ -126,22 +142,50 @@ class CargoSettings(object):
     window = None
     # Data in the sublime project file.  Empty dictionary if nothing is set.
     project_data = None
+    # True once `load` has run, making repeated calls free.
+    _loaded = False
 
     def __init__(self, window):
         self.window = window
 
+    @classmethod
+    def get(cls, window):
+        """Return the shared instance for the given window, freshly loaded.
+
+        Sharing one instance per window avoids rebuilding the settings
+        object for every command, while re-loading here keeps the project
+        data current (Sublime updates it when the project file is saved).
+
+        Only call this from the main thread: each retrieval reloads the
+        shared instance.  Worker threads must build their own
+        `CargoSettings` (or be handed one loaded up front) so a later
+        command can't reload the data out from under them.
+        """
+        settings = _SETTINGS_BY_WINDOW.get(window.id())
+        if settings is None:
+            settings = cls(window)
+            _SETTINGS_BY_WINDOW[window.id()] = settings
+        else:
+            settings.window = window
+            settings._loaded = False
+        settings.load()
+        return settings
+
     def load(self):
-        self.project_data = self.window.project_data()
-        if self.project_data is None:
-            # Window does not have a Sublime project.
-            self.project_data = {}
+        if self._loaded:
+            return
+        self._loaded = True
+        # Publish in one assignment; `project_data` must never be observed
+        # as None by a concurrent reader.
+        pdata = self.window.project_data()
+        self.project_data = pdata if pdata is not None else {}
         self.re_settings = sublime.load_settings('RustEnhanced.sublime-settings')
 
     def get_global_default(self, key, default=None):
-        internal_default = CARGO_BUILD_DEFAULTS.get('defaults', {})\
+        internal_default = CARGO_BUILD_DEFAULTS.get('defaults', _EMPTY)\
                                                .get(key, default)
-        return self.re_settings.get('cargo_build', {})\
-                               .get('defaults', {})\
+        return self.re_settings.get('cargo_build', _EMPTY)\
+                               .get('defaults', _EMPTY)\
                                .get(key, internal_default)
 
     def set_global_default(self, key, value):
@@ -150,25 +194,35 @@ class CargoSettings(object):
         self.re_settings.set('cargo_build', cb)
         sublime.save_settings('RustEnhanced.sublime-settings')
 
+    def _project_cargo_build(self):
+        """The `settings/cargo_build` table from the project data, or
+        `_EMPTY` if not set."""
+        return self.project_data.get('settings', _EMPTY)\
+                                .get('cargo_build', _EMPTY)
+
+    def _project_path_data(self, path):
+        """The per-package table for `path`, or `_EMPTY` if not set."""
+        return self._project_cargo_build().get('paths', _EMPTY)\
+                                          .get(os.path.normpath(path), _EMPTY)
+
     def get_project_default(self, key, default=None):
-        return self.project_data.get('settings', {})\
-                                .get('cargo_build', {})\
-                                .get('defaults', {})\
-                                .get(key, default)
+        return self._project_cargo_build().get('defaults', _EMPTY)\
+                                          .get(key, default)
 
     def set_project_default(self, key, value):
-        self.project_data.setdefault('settings', {})\
-                         .setdefault('cargo_build', {})\
-                         .setdefault('defaults', {})[key] = value
+        if self.get_project_default(key) == value:
+            return
+        _descend(self.project_data, 'settings', 'cargo_build',
+                 'defaults')[key] = value
         self._set_project_data()
 
     def get_global_variant(self, variant, key, default=None):
-        internal_default = CARGO_BUILD_DEFAULTS.get('variants', {})\
-                                               .get(variant, {})\
+        internal_default = CARGO_BUILD_DEFAULTS.get('variants', _EMPTY)\
+                                               .get(variant, _EMPTY)\
                                                .get(key, default)
-        return self.re_settings.get('cargo_build', {})\
-                               .get('variants', {})\
-                               .get(variant, {})\
+        return self.re_settings.get('cargo_build', _EMPTY)\
+                               .get('variants', _EMPTY)\
+                               .get(variant, _EMPTY)\
                                .get(key, internal_default)
 
     def set_global_variant(self, variant, key, value):
@@ -179,85 +233,59 @@ class CargoSettings(object):
         sublime.save_settings('RustEnhanced.sublime-settings')
 
     def get_project_variant(self, variant, key, default=None):
-        return self.project_data.get('settings', {})\
-                                .get('cargo_build', {})\
-                                .get('variants', {})\
-                                .get(variant, {})\
-                                .get(key, default)
+        return self._project_cargo_build().get('variants', _EMPTY)\
+                                          .get(variant, _EMPTY)\
+                                          .get(key, default)
 
     def set_project_variant(self, variant, key, value):
-        self.project_data.setdefault('settings', {})\
-                         .setdefault('cargo_build', {})\
-                         .setdefault('variants', {})\
-                         .setdefault(variant, {})[key] = value
+        if self.get_project_variant(variant, key) == value:
+            return
+        _descend(self.project_data, 'settings', 'cargo_build',
+                 'variants', variant)[key] = value
         self._set_project_data()
 
     def get_project_package_default(self, path, key, default=None):
-        path = os.path.normpath(path)
-        return self.project_data.get('settings', {})\
-                                .get('cargo_build', {})\
-                                .get('paths', {})\
-                                .get(path, {})\
-                                .get('defaults', {})\
-                                .get(key, default)
+        return self._project_path_data(path).get('defaults', _EMPTY)\
+                                            .get(key, default)
 
     def set_project_package_default(self, path, key, value):
-        path = os.path.normpath(path)
-        self.project_data.setdefault('settings', {})\
-                         .setdefault('cargo_build', {})\
-                         .setdefault('paths', {})\
-                         .setdefault(path, {})\
-                         .setdefault('defaults', {})[key] = value
+        if self.get_project_package_default(path, key) == value:
+            return
+        _descend(self.project_data, 'settings', 'cargo_build', 'paths',
+                 os.path.normpath(path), 'defaults')[key] = value
         self._set_project_data()
 
     def get_project_package_variant(self, path, variant, key, default=None):
-        path = os.path.normpath(path)
-        return self.project_data.get('settings', {})\
-                                .get('cargo_build', {})\
-                                .get('paths', {})\
-                                .get(path, {})\
-                                .get('variants', {})\
-                                .get(variant, {})\
-                                .get(key, default)
+        return self._project_path_data(path).get('variants', _EMPTY)\
+                                            .get(variant, _EMPTY)\
+                                            .get(key, default)
 
     def set_project_package_variant(self, path, variant, key, value):
-        path = os.path.normpath(path)
-        self.project_data.setdefault('settings', {})\
-                         .setdefault('cargo_build', {})\
-                         .setdefault('paths', {})\
-                         .setdefault(path, {})\
-                         .setdefault('variants', {})\
-                         .setdefault(variant, {})[key] = value
+        if self.get_project_package_variant(path, variant, key) == value:
+            return
+        _descend(self.project_data, 'settings', 'cargo_build', 'paths',
+                 os.path.normpath(path), 'variants', variant)[key] = value
         self._set_project_data()
 
     def get_project_package_target(self, path, target, key, default=None):
-        path = os.path.normpath(path)
-        return self.project_data.get('settings', {})\
-                                .get('cargo_build', {})\
-                                .get('paths', {})\
-                                .get(path, {})\
-                                .get('targets', {})\
-                                .get(target, {})\
-                                .get(key, default)
+        return self._project_path_data(path).get('targets', _EMPTY)\
+                                            .get(target, _EMPTY)\
+                                            .get(key, default)
 
     def set_project_package_target(self, path, target, key, value):
-        path = os.path.normpath(path)
-        self.project_data.setdefault('settings', {})\
-                         .setdefault('cargo_build', {})\
-                         .setdefault('paths', {})\
-                         .setdefault(path, {})\
-                         .setdefault('targets', {})\
-                         .setdefault(target, {})[key] = value
+        if self.get_project_package_target(path, target, key) == value:
+            return
+        _descend(self.project_data, 'settings', 'cargo_build', 'paths',
+                 os.path.normpath(path), 'targets', target)[key] = value
         self._set_project_data()
 
     def get_project_base(self, key, default=None):
-        return self.project_data.get('settings', {})\
-                                .get('cargo_build', {})\
-                                .get(key, default)
+        return self._project_cargo_build().get(key, default)
 
     def set_project_base(self, key, value):
-        self.project_data.setdefault('settings', {})\
-                         .setdefault('cargo_build', {})[key] = value
+        if self.get_project_base(key) == value:
+            return
+        _descend(self.project_data, 'settings', 'cargo_build')[key] = value
         self._set_project_data()
 
     def _set_project_data(self):
@@ -322,27 +350,27 @@ class CargoSettings(object):
         each level.  This is primarily used for the `env` environment
         variables.
         """
-        result = self.get_global_default(key, {}).copy()
+        result = self.get_global_default(key, _EMPTY).copy()
 
-        proj_def = self.get_project_default(key, {})
+        proj_def = self.get_project_default(key, _EMPTY)
         result.update(proj_def)
 
-        glbl_var = self.get_global_variant(variant, key, {})
+        glbl_var = self.get_global_variant(variant, key, _EMPTY)
         result.update(glbl_var)
 
-        proj_var = self.get_project_variant(variant, key, {})
+        proj_var = self.get_project_variant(variant, key, _EMPTY)
         result.update(proj_var)
 
-        pp_def = self.get_project_package_default(settings_path, key, {})
+        pp_def = self.get_project_package_default(settings_path, key, _EMPTY)
         result.update(pp_def)
 
-        pp_var = self.get_project_package_variant(settings_path, variant, key, {})
+        pp_var = self.get_project_package_variant(settings_path, variant, key, _EMPTY)
         result.update(pp_var)
 
-        pp_tar = self.get_project_package_target(settings_path, target, key, {})
+        pp_tar = self.get_project_package_target(settings_path, target, key, _EMPTY)
         result.update(pp_tar)
 
-        initial = initial_settings.get(key, {})
+        initial = initial_settings.get(key, _EMPTY)
         result.update(initial)
         return result
 
@@ -376,12 +404,26 @@ class CargoSettings(object):
 
             Returns None if the command cannot be constructed.
         """
-        target = self.determine_target(cmd_name, settings_path,
-            cmd_info=cmd_info, override=initial_settings.get('target'))
+        # Fast path for the common case of no cargo_build configuration and
+        # no overrides: every settings probe below would fall through to its
+        # default, so skip the full fallback chain (and target detection,
+        # which could only ever yield None).
+        unconfigured = (not initial_settings and
+                        not self._project_cargo_build() and
+                        not self.re_settings.get('cargo_build'))
+        if unconfigured:
+            target = None
+
+            def get_computed(key, default=None):
+                return CARGO_BUILD_DEFAULTS.get('defaults', _EMPTY)\
+                                           .get(key, default)
+        else:
+            target = self.determine_target(cmd_name, settings_path,
+                cmd_info=cmd_info, override=initial_settings.get('target'))
 
-        def get_computed(key, default=None):
-            return self.get_computed(settings_path, cmd_name, target, key,
-                default=default, initial_settings=initial_settings)
+            def get_computed(key, default=None):
+                return self.get_computed(settings_path, cmd_name, target, key,
+                    default=default, initial_settings=initial_settings)
 
         result = ['cargo']
 
@@ -436,9 +478,15 @@ class CargoSettings(object):
                 script_path = self.window.active_view().file_name()
             result.append(script_path)
 
+        # `extract_variables` rebuilds its dictionary from window state on
+        # every call, so fetch it once and only if something needs expanding.
+        variables = None
+
         def expand(s):
-            return sublime.expand_variables(s,
-                self.window.extract_variables())
+            nonlocal variables
+            if variables is None:
+                variables = self.window.extract_variables()
+            return sublime.expand_variables(s, variables)
 
         # Extra args.
         extra_cargo_args = get_computed('extra_cargo_args')
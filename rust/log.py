@@ -76,11 +76,21 @@ def critical(window, msg, *args):
         print(msg)
 
 
+def _get_wlog(window):
+    """Fetch the window's log, creating it on first use.
+
+    Avoids `setdefault`, which would construct a throwaway WindowLog on
+    every call.
+    """
+    wlog = logs.get(window.id())
+    if wlog is None:
+        wlog = logs[window.id()] = WindowLog()
+    return wlog
+
+
 def log(window, msg, *args):
     """Add a log message."""
-    global logs
-    wlog = logs.setdefault(window.id(), WindowLog())
-    wlog.add_message(msg, args)
+    _get_wlog(window).add_message(msg, args)
 
 
 def clear_log(window):
@@ -97,7 +107,7 @@ class RustOpenLog(sublime_plugin.WindowCommand):
     plugin."""
 
     def run(self):
-        wlog = logs.setdefault(self.window.id(), WindowLog())
+        wlog = _get_wlog(self.window)
         if wlog.view:
             self.window.focus_view(wlog.view)
         else:
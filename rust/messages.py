@@ -233,8 +233,9 @@ def clear_messages(window, soft=False):
 def clear_all_messages():
     """Remove all messages in all windows."""
     for window in sublime.windows():
-        if window.id() in WINDOW_MESSAGES:
-            clear_messages(window)
+        # `clear_messages` handles windows without messages, so no need to
+        # probe WINDOW_MESSAGES twice.
+        clear_messages(window)
 
 
 def add_message(window, message):
@@ -251,6 +252,11 @@ def has_message_for_path(window, path):
     return path in paths
 
 
+def has_any_messages():
+    """Quick check whether any messages exist in any window."""
+    return bool(WINDOW_MESSAGES)
+
+
 def messages_finished(window):
     """This should be called after all messages have been added."""
     _sort_messages(window)
@@ -63,6 +63,9 @@ class OutputListener(rust_proc.ProcListener):
         self.base_path = base_path
         self.command_name = command_name
         self.rustc_version = rustc_version
+        # Rust 1.24 changed column numbering to be 1-based.  Computed once
+        # here rather than re-parsing the version range per output line.
+        self.one_based_columns = semver.match(rustc_version, '>=1.24.0-beta')
 
     def on_begin(self, proc):
         self.output_view = create_output_panel(self.window, self.base_path)
@@ -89,8 +92,7 @@ class OutputListener(rust_proc.ProcListener):
                 lineno = int(m.group(2)) - 1
                 # Region columns appear to the left, so this is +1.
                 col = int(m.group(3))
-                # Rust 1.24 changed column numbering to be 1-based.
-                if semver.match(self.rustc_version, '>=1.24.0-beta'):
+                if self.one_based_columns:
                     col -= 1
                 message.span = ((lineno, col), (lineno, col))
                 # +2 to skip ", "
@@ -19,8 +19,10 @@ class RustThread(object):
     Subclasses should check `should_exit` around any long-running steps.
     """
 
-    # threading.Thread instance
+    # threading.Thread instance, or None when running synchronously.
     thread = None
+    # Event signalled when a synchronous run finishes (see `start`).
+    _sync_done = None
     # If this is true, then it is OK to kill this thread to start a new one.
     silently_interruptible = True
     # Set to True when the thread should terminate.
@@ -33,11 +35,26 @@ class RustThread(object):
     def __init__(self, window):
         self.window = window
 
-    def start(self):
-        """Start the thread."""
-        self.thread = threading.Thread(name=self.name,
-            target=self._thread_run)
-        self.thread.start()
+    def start(self, synchronous=False):
+        """Start the thread.
+
+        If `synchronous` is True, run on the calling thread instead of
+        spawning a new one, returning once the command finishes.  The
+        caller must be prepared to block (including on the "cancel the
+        running command?" dialog).
+        """
+        if synchronous:
+            # No worker thread is created; `is_alive` and `join` consult
+            # this event instead of a Thread object.
+            self._sync_done = threading.Event()
+            try:
+                self._thread_run()
+            finally:
+                self._sync_done.set()
+        else:
+            self.thread = threading.Thread(name=self.name,
+                target=self._thread_run)
+            self.thread.start()
 
     @property
     def current_proc(self):
@@ -109,7 +126,14 @@ class RustThread(object):
             p.terminate()
 
     def is_alive(self):
+        if self.thread is None:
+            # Synchronous run.
+            return not self._sync_done.is_set()
         return self.thread.is_alive()
 
     def join(self, timeout=None):
+        if self.thread is None:
+            # Synchronous run; wait for the owning thread to finish it.
+            self._sync_done.wait(timeout)
+            return
         return self.thread.join(timeout=timeout)
@@ -2,6 +2,7 @@
 
 import sublime
 import textwrap
+import time
 import os
 
 
@@ -27,20 +28,37 @@ def multiline_fix(s):
     return textwrap.dedent(s).lstrip()
 
 
+# Cached handles from `sublime.load_settings`.  Settings objects are live
+# (Sublime updates them when the file changes), so they only need to be
+# loaded once.  Loaded lazily since the API is not available at import
+# time.
+_RUST_SETTINGS = None
+_PREF_SETTINGS = None
+
+
 def get_setting(name, default=None):
     """Retrieve a setting from Sublime settings."""
+    global _RUST_SETTINGS, _PREF_SETTINGS
     pdata = sublime.active_window().project_data()
     if pdata:
         v = pdata.get('settings', {}).get(name)
         if v is not None:
             return v
-    settings = sublime.load_settings('RustEnhanced.sublime-settings')
-    v = settings.get(name)
+    if _RUST_SETTINGS is None:
+        _RUST_SETTINGS = sublime.load_settings('RustEnhanced.sublime-settings')
+        _PREF_SETTINGS = sublime.load_settings('Preferences.sublime-settings')
+    v = _RUST_SETTINGS.get(name)
     if v is not None:
         return v
-    settings = sublime.load_settings('Preferences.sublime-settings')
     # XXX: Also check "Distraction Free"?
-    return settings.get(name, default)
+    return _PREF_SETTINGS.get(name, default)
+
+
+# Cache of `rustc --version` output, keyed by (cwd, toolchain).  Spawning
+# rustc on every build just to read its version is wasteful; the TTL keeps
+# toolchain updates and rustup overrides from going unnoticed for long.
+_RUSTC_VERSION_CACHE = {}
+_RUSTC_VERSION_TTL = 30
 
 
 def get_rustc_version(window, cwd, toolchain=None):
@@ -48,6 +66,10 @@ def get_rustc_version(window, cwd, toolchain=None):
 
     :Returns: A string such as '1.16.0' or '1.17.0-nightly'.
     """
+    key = (cwd, toolchain)
+    entry = _RUSTC_VERSION_CACHE.get(key)
+    if entry is not None and time.time() - entry[0] < _RUSTC_VERSION_TTL:
+        return entry[1]
     from . import rust_proc
     cmd = ['rustc']
     if toolchain:
@@ -58,7 +80,16 @@ def get_rustc_version(window, cwd, toolchain=None):
     # rustc 1.15.1 (021bd294c 2017-02-08)
     # rustc 1.16.0-beta.2 (bc15d5281 2017-02-16)
     # rustc 1.17.0-nightly (306035c21 2017-02-18)
-    return output.split()[1]
+    version = output.split()[1]
+    _RUSTC_VERSION_CACHE[key] = (time.time(), version)
+    return version
+
+
+# Map directory to the directory containing its Cargo.toml, as determined
+# by `find_cargo_manifest`.  Every intermediate directory of a walk
+# resolves to the same answer, so they are all recorded.  Misses are not
+# cached (a manifest may be created later).
+_MANIFEST_CACHE = {}
 
 
 def find_cargo_manifest(path):
@@ -69,10 +100,22 @@ def find_cargo_manifest(path):
     path = os.path.normpath(path)
     if os.path.isfile(path):
         path = os.path.dirname(path)
+    cached = _MANIFEST_CACHE.get(path)
+    if cached is not None:
+        # One stat to verify the cached manifest still exists, instead of
+        # one per directory level.
+        if os.path.exists(os.path.join(cached, 'Cargo.toml')):
+            return cached
+        del _MANIFEST_CACHE[path]
+    walked = []
     while True:
         manifest = os.path.join(path, 'Cargo.toml')
         if os.path.exists(manifest):
+            for d in walked:
+                _MANIFEST_CACHE[d] = path
+            _MANIFEST_CACHE[path] = path
             return path
+        walked.append(path)
         parent = os.path.dirname(path)
         if parent == path:
             return None
@@ -105,9 +148,23 @@ def is_rust_view(settings):
     return (s == 'Packages/%s/RustEnhanced.sublime-syntax' % (PACKAGE_NAME,))
 
 
+# Cache of `cargo metadata` output.  Keyed by (manifest dir, toolchain);
+# each entry records the mtimes of every manifest the output was derived
+# from — the root Cargo.toml plus each workspace member's Cargo.toml (taken
+# from the metadata itself) — so editing any of them invalidates it.
+# Deliberately insensitive to Cargo.lock: with --no-deps the output is
+# derived from the manifests alone, so dependency updates don't need to
+# invalidate the cache.
+_METADATA_CACHE = {}
+
+
 def get_cargo_metadata(window, cwd, toolchain=None):
     """Load Cargo metadata.
 
+    Output is cached, keyed on the modification times of the workspace's
+    manifests, since running `cargo metadata` spawns a subprocess.  Use
+    `clear_metadata_cache` to force a re-run.
+
     :returns: None on failure, otherwise a dictionary from Cargo:
         - packages: List of packages:
             - name
@@ -126,6 +183,12 @@ def get_cargo_metadata(window, cwd, toolchain=None):
 
     :raises ProcessTermiantedError: Process was terminated by another thread.
     """
+    manifest_dir = find_cargo_manifest(cwd)
+    if manifest_dir:
+        key = (manifest_dir, toolchain)
+        entry = _METADATA_CACHE.get(key)
+        if entry is not None and _manifest_mtimes(entry[0]) == entry[1]:
+            return entry[2]
     from . import rust_proc
     cmd = ['cargo']
     if toolchain:
@@ -135,9 +198,39 @@ def get_cargo_metadata(window, cwd, toolchain=None):
                                   cmd,
                                   cwd=cwd)
     if output:
-        return output[0]
+        result = output[0]
     else:
-        return None
+        result = None
+    if manifest_dir and result is not None:
+        paths = _metadata_manifest_paths(manifest_dir, result)
+        _METADATA_CACHE[key] = (paths, _manifest_mtimes(paths), result)
+    return result
+
+
+def clear_metadata_cache():
+    """Discard all cached `cargo metadata` output."""
+    _METADATA_CACHE.clear()
+
+
+def _metadata_manifest_paths(manifest_dir, metadata):
+    """Every manifest path the given metadata was derived from: each
+    package's (workspace members with --no-deps) plus the root Cargo.toml,
+    which may be a virtual manifest with no package of its own."""
+    paths = {os.path.join(manifest_dir, 'Cargo.toml')}
+    for package in metadata.get('packages', []):
+        paths.add(package['manifest_path'])
+    return tuple(sorted(paths))
+
+
+def _manifest_mtimes(paths):
+    """Modification time of each path (None if absent)."""
+    mtimes = []
+    for path in paths:
+        try:
+            mtimes.append(os.stat(path).st_mtime)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
 
 
 def icon_path(level, res=None):
@@ -11,12 +11,15 @@ class ToggleRustSyntaxSettingCommand(sublime_plugin.WindowCommand):
         window = self.window
         current_state = util.get_setting('rust_syntax_checking', True)
         new_state = not current_state
-        pdata = window.project_data()
+        pdata = window.project_data() or {}
         pdata.setdefault('settings', {})['rust_syntax_checking'] = new_state
+        # Commit the project data before touching the UI so the toggle takes
+        # effect immediately and nothing can mutate it between read and
+        # write.
+        window.set_project_data(pdata)
         if not new_state:
             messages.clear_messages(window)
         window.status_message("Rust syntax checking is now " + ("inactive" if current_state else "active"))
-        window.set_project_data(pdata)
 
     def is_checked(self):
         return util.get_setting('rust_syntax_checking', True)